@@ -28,7 +28,7 @@ class FilterComplex:
         :return: first stream of this kind not connected to filter graph
         """
         for stream in self.__input_list.streams:
-            if stream.kind != kind or stream.connected:
+            if stream.kind is not kind or stream.connected:
                 continue
             return stream
         else:
@@ -152,12 +152,14 @@ class FFMPEG(BaseWrapper):
         :param kind: stream type
         :return: first stream of this kind not connected to destination
         """
-        for stream in self.__inputs.streams:
-            if stream.kind != kind or stream.connected:
-                continue
-            return stream
-        else:
-            raise RuntimeError("no free streams")
+        # Walking input streams lazily instead of flattening the whole
+        # `InputList.streams` for each codec connected to a free source.
+        for source in self.__inputs:
+            for stream in source.streams:
+                if stream.kind is not kind or stream.connected:
+                    continue
+                return stream
+        raise RuntimeError("no free streams")
 
     def _add_codec(self, c: Codec) -> Optional[Codec]:
         """ Connect codec to filter graph output or input stream.
@@ -186,13 +188,15 @@ class FFMPEG(BaseWrapper):
 
         with base.Namer():
             fc = str(self.__filter_complex)
-            fc_args = ['-filter_complex', fc] if fc else []
+            # parameter name is a constant, so only filter graph is encoded
+            fc_args = [b'-filter_complex', ensure_binary(fc)] if fc else []
 
             # Namer context is used to generate unique output stream names
-            return (super().get_args() +
-                    self.__inputs.get_args() +
-                    ensure_binary(fc_args) +
-                    self.__outputs.get_args())
+            args = super().get_args()
+            args.extend(self.__inputs.get_args())
+            args.extend(fc_args)
+            args.extend(self.__outputs.get_args())
+            return args
 
     def add_input(self, input_file: Input) -> Input:
         """ Adds new source to ffmpeg.
@@ -227,11 +231,18 @@ class FFMPEG(BaseWrapper):
         :param line: ffmpeg output line
         :returns: line to be appended to whole ffmpeg output.
         """
-        if not self.stderr_markers:
+        markers = self.stderr_markers
+        if not markers:
             # if no markers are defined, handle each line
             return super().handle_stderr(line)
+        # Markers usually start with same character (i.e. "["), so most of
+        # ffmpeg output lines are skipped with a single substring check.
+        first = markers[0][:1]
+        if first not in line and all(m.startswith(first) for m in markers):
+            # line can't contain any of markers
+            return ''
         # capture only lines containing markers
-        for marker in self.stderr_markers:
+        for marker in markers:
             if marker in line:
                 return super().handle_stderr(line)
         return ''
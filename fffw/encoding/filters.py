@@ -1,5 +1,8 @@
-from dataclasses import dataclass, replace, asdict, field, fields
-from typing import Union, List, cast, Optional, TYPE_CHECKING
+import sys
+from dataclasses import dataclass, replace, field
+from itertools import chain, groupby
+from typing import Union, List, cast, Optional, Any, Tuple, Dict
+from typing import TYPE_CHECKING
 
 from fffw.graph import base
 from fffw.encoding import mixins
@@ -29,6 +32,14 @@ __all__ = [
 ]
 
 
+_TS_OR_NONE = (TS, type(None))
+""" Types of Trim interval bounds which don't need TS conversion."""
+_SPLIT_ARGS: Dict[int, str] = {2: ''}
+""" Split filter args cache by number of outputs."""
+_CONCAT_ARGS: Dict[Tuple[StreamType, int], str] = {}
+""" Concat filter args cache by stream kind and number of inputs."""
+
+
 def ensure_video(meta: Meta, *_: Meta) -> VideoMeta:
     """
     Checks that first passed stream is a video stream
@@ -62,15 +73,62 @@ class Filter(mixins.StreamValidationMixin, base.Node, Params,
     ALLOWED = ('enabled',)
     """ fields that are allowed to be modified after filter initialization."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get('__hash__', None) is None:
+            # dataclass decorator disables hashing for subclasses with
+            # `eq=True`, so content-based hash is inherited explicitly.
+            setattr(cls, '__hash__', Filter.__hash__)
+
+    def __hash__(self) -> int:
+        """
+        Filter parameters are frozen after initialization, so hash is computed
+        once from filter type and the same field values that are compared by
+        dataclass `__eq__`. Fields allowed to be modified are not hashed.
+        """
+        try:
+            return cast(int, self.__dict__['_hash'])
+        except KeyError:
+            pass
+        allowed = self.ALLOWED
+        values = tuple(getattr(self, f.name) for f in self._fields
+                       if f.compare and f.name not in allowed)
+        try:
+            result = hash((type(self),) + values)
+        except TypeError:
+            # Filters with unhashable parameter values (i.e. lists) are still
+            # compared by values in `__eq__`, so only filter type is hashed.
+            result = hash(type(self))
+        if self._frozen:
+            self.__dict__['_hash'] = result
+        return result
+
     @property
     def args(self) -> str:
         """ Formats filter args as k=v pairs separated by colon."""
-        args = self.as_pairs()
-        result = []
-        for key, value in args:
-            if key and value:
-                result.append(f'{key}={value}')
-        return ':'.join(result)
+        try:
+            return cast(str, self.__dict__['_args'])
+        except KeyError:
+            pass
+        args = ':'.join([f'{key}={value}' for key, value in self.as_pairs()
+                         if key and value])
+        if self._frozen and self._args_cacheable():
+            # Parameters are frozen, so args are computed only once.
+            self.__dict__['_args'] = args
+        return args
+
+    def _args_cacheable(self) -> bool:
+        """
+        :returns: True if rendered args can't change after initialization.
+
+        Args are rendered on each access if there are lazy (callable)
+        parameter values or parameters allowed to be modified.
+        """
+        allowed = self.ALLOWED
+        for key, *_ in self._param_rules():
+            if key in allowed or callable(getattr(self, key)):
+                return False
+        return True
 
     def split(self, count: int = 1) -> List["Filter"]:
         """
@@ -100,18 +158,21 @@ class Filter(mixins.StreamValidationMixin, base.Node, Params,
         """
         if count == 1:
             return [self]
-        result = []
-        for _ in range(count):
-            result.append(self._clone())
+        # Filter parameters are collected once for all copies.
+        kwargs = self._clone_kwargs()
+        factory = type(self)
+        # noinspection PyArgumentList
+        result = [factory(**kwargs) for _ in range(count)]
 
-        for i, edge in enumerate(self.inputs):
+        for edge in self.inputs:
             if edge is None:
                 continue
-            # reconnecting incoming edge to split filter
+            # reconnecting incoming edge to split filter; each input edge
+            # carries a distinct stream, so it needs its own split.
             split = Split(self.kind, output_count=count)
             edge.reconnect(split)
             for dst in result:
-                split | dst
+                split.connect_dest(dst)
 
         return result
 
@@ -121,10 +182,31 @@ class Filter(mixins.StreamValidationMixin, base.Node, Params,
 
         Inputs and outputs are not copied.
         """
-        skip = [f.name for f in fields(self) if not f.init]
-        kwargs = {k: v for k, v in asdict(self).items() if k not in skip}
         # noinspection PyArgumentList
-        return type(self)(**kwargs)  # type: ignore
+        return type(self)(**self._clone_kwargs())
+
+    def _clone_kwargs(self) -> Dict[str, Any]:
+        """
+        :returns: constructor arguments to create a copy of current filter.
+        """
+        # Field values are frozen, so they are passed to a copy as is instead
+        # of deep-copying them with `asdict`.
+        return {k: getattr(self, k) for k in self._init_field_names()}
+
+    @classmethod
+    def _init_field_names(cls) -> Tuple[str, ...]:
+        """
+        :returns: names of fields passed to filter constructor, cached for each
+            filter class.
+        """
+        try:
+            return cast(Tuple[str, ...], cls.__dict__['_init_fields'])
+        except KeyError:
+            # Dataclass fields are not yet initialized in `__init_subclass__`,
+            # so field names are collected on first use.
+            names = tuple(f.name for f in cls._class_fields() if f.init)
+            setattr(cls, '_init_fields', names)
+            return names
 
 
 class VideoFilter(Filter):
@@ -173,8 +255,8 @@ class AutoFilter(Filter):
 
     def __post_init__(self) -> None:
         """ Adds audio prefix to filter name for audio filters."""
-        if self.kind == AUDIO:
-            self.filter = f'a{self.filter}'
+        if self.kind is AUDIO:
+            self.filter = sys.intern(f'a{self.filter}')
         super().__post_init__()
 
 
@@ -230,9 +312,11 @@ class Split(AutoFilter):
         """
         :returns: split/asplit filter parameters
         """
-        if len(self.outputs) == 2:
-            return ''
-        return str(len(self.outputs))
+        count = len(self.outputs)
+        args = _SPLIT_ARGS.get(count)
+        if args is None:
+            args = _SPLIT_ARGS[count] = str(count)
+        return args
 
     def disconnect(self, edge: base.Edge) -> Optional[base.Edge]:
         """
@@ -284,9 +368,9 @@ class Trim(AutoFilter):
     end: Union[int, float, str, TS]
 
     def __post_init__(self) -> None:
-        if not isinstance(self.start, (TS, type(None))):
+        if not isinstance(self.start, _TS_OR_NONE):
             self.start = TS(self.start)
-        if not isinstance(self.end, (TS, type(None))):
+        if not isinstance(self.end, _TS_OR_NONE):
             self.end = TS(self.end)
         super().__post_init__()
 
@@ -304,25 +388,30 @@ class Trim(AutoFilter):
         streams: List[str] = []
         start = self.start or TS(0)
         end = min(meta.duration, self.end or TS(0))
+        # trim interval is loop-invariant
+        trim_start = self.start
+        trim_end = self.end
         for scene in meta.scenes:
-            if scene.stream and (not streams or streams[0] != scene.stream):
+            stream = scene.stream
+            if stream and (not streams or streams[0] != stream):
                 # Adding an input stream without contiguous duplicates.
-                streams.append(scene.stream)
+                streams.append(stream)
 
             # intersect scene with trim interval
-            start = cast(TS, max(self.start, scene.position))
-            end = cast(TS, min(self.end, scene.position + scene.duration))
+            position = scene.position
+            start = cast(TS, max(trim_start, position))
+            end = cast(TS, min(trim_end, position + scene.duration))
 
             if start < end:
                 # If intersection is not empty, add intersection to resulting
                 # scenes list.
                 # This will allow detecting buffering when multiple scenes are
                 # reordered in same file: input[3:4] + input[1:2]
-                offset = start - scene.position
+                offset = start - position
                 scenes.append(Scene(
-                    stream=scene.stream,
+                    stream=stream,
                     start=scene.start + offset,
-                    position=scene.position + offset,
+                    position=position + offset,
                     duration=end - start))
 
         duration = cast(TS, end) - cast(TS, start)
@@ -356,10 +445,14 @@ class SetPTS(AutoFilter):
 
     expr: str = param(default=RESET_PTS)
 
+    def __post_init__(self) -> None:
+        # Expression is normalized once as filter parameters are frozen.
+        self.__reset = self.expr.replace(' ', '') == self.RESET_PTS
+        super().__post_init__()
+
     def transform(self, *metadata: Meta) -> Meta:
         meta = metadata[0]
-        expr = self.expr.replace(' ', '')
-        if expr == self.RESET_PTS:
+        if self.__reset:
             return replace(meta, start=TS(0))
         raise NotImplementedError()
 
@@ -392,11 +485,18 @@ class Concat(Filter):
 
     @property
     def args(self) -> str:
-        if self.kind == VIDEO:
-            if self.input_count == 2:
-                return ''
-            return 'n=%s' % self.input_count
-        return 'v=0:a=1:n=%s' % self.input_count
+        key = (self.kind, self.input_count)
+        args = _CONCAT_ARGS.get(key)
+        if args is None:
+            if self.kind is VIDEO:
+                if self.input_count == 2:
+                    args = ''
+                else:
+                    args = f'n={self.input_count}'
+            else:
+                args = f'v=0:a=1:n={self.input_count}'
+            _CONCAT_ARGS[key] = args
+        return args
 
     def transform(self, *metadata: Meta) -> Meta:
         """
@@ -407,25 +507,19 @@ class Concat(Filter):
             stream durations. Scenes and streams are also concatenated.
         """
         duration = TS(0)
-        scenes = []
-        streams: List[str] = []
-        frames: int = 0
+        scenes: List[Scene] = []
         for meta in metadata:
-            for scene in meta.scenes:
-                scenes.append(Scene(
-                    stream=scene.stream,
-                    duration=scene.duration,
-                    start=scene.start,
-                    position=scene.position + duration,
-                ))
+            scenes.extend(Scene(
+                stream=scene.stream,
+                duration=scene.duration,
+                start=scene.start,
+                position=scene.position + duration,
+            ) for scene in meta.scenes)
             duration += meta.duration
-            for stream in meta.streams:
-                if not streams or streams[-1] != stream:
-                    # Add all streams for each concatenated metadata and remove
-                    # contiguous duplicates.
-                    streams.append(stream)
-            if isinstance(meta, VideoMeta):
-                frames += meta.frames
+        # Add all streams for each concatenated metadata and remove contiguous
+        # duplicates.
+        all_streams = chain.from_iterable(meta.streams for meta in metadata)
+        streams = [stream for stream, _ in groupby(all_streams)]
         kwargs = dict(duration=duration, scenes=scenes, streams=streams)
         meta = metadata[0]
         if isinstance(meta, AudioMeta):
@@ -472,12 +566,6 @@ class Upload(VideoFilter):
     extra_hw_frames: int = param(default=64, init=False)
     device: Device = param(skip=True)
 
-    def __post_init__(self) -> None:
-        if isinstance(self.device, dict):
-            # deserialize back after filter cloning
-            self.device = Device(**self.device)
-        super().__post_init__()
-
     def transform(self, *metadata: Meta) -> VideoMeta:
         """ Marks a stream as uploaded to a device."""
         meta = ensure_video(*metadata)
@@ -1,5 +1,7 @@
+import sys
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, cast, Iterable, Union, Any
+from itertools import chain
+from typing import Optional, List, Tuple, cast, Iterable, Union, Any, Dict
 
 from fffw.encoding import filters, outputs
 from fffw.graph import base
@@ -30,7 +32,15 @@ class Stream(base.Source):
 
     @property
     def name(self) -> str:
-        return f'{self.source.index}:{self._kind.value}:{self.index}'
+        try:
+            return cast(str, self.__dict__['_name'])
+        except KeyError:
+            pass
+        # Source index and stream index are set only once, so stream name
+        # never changes after it is computed.
+        name = f'{self.source.index}:{self._kind.value}:{self.index}'
+        self.__dict__['_name'] = name
+        return name
 
     def split(self, count: int = 1) -> List[filters.Filter]:
         """
@@ -140,24 +150,22 @@ class Input(BaseWrapper):
         Add a link to self to input streams and enumerate streams to get
         proper stream index for input.
         """
-        video_streams = 0
-        audio_streams = 0
+        indices: Dict[StreamType, int] = {}
         if self.streams is None:
             raise RuntimeError("Streams not initialized")
 
         for stream in self.streams:
-            if stream.kind == VIDEO:
+            kind = stream.kind
+            if kind is VIDEO:
                 meta: Optional[VideoMeta] = getattr(stream, 'meta', None)
                 if self.hardware and self.device and meta:
                     meta.device = Device(hardware=self.hardware,
                                          name=self.device)
-                stream.index = video_streams
-                video_streams += 1
-            elif stream.kind == AUDIO:
-                stream.index = audio_streams
-                audio_streams += 1
-            else:
-                raise ValueError(stream.kind)
+            elif kind is not AUDIO:
+                raise ValueError(kind)
+            index = indices.get(kind, 0)
+            stream.index = index
+            indices[kind] = index + 1
             stream.source = self
 
     @property
@@ -175,7 +183,7 @@ class Input(BaseWrapper):
         :raises KeyError: if no streams of this kind found.
         """
         for stream in self.streams:
-            if stream.kind == kind:
+            if stream.kind is kind:
                 return stream
         raise KeyError(kind)
 
@@ -183,7 +191,9 @@ class Input(BaseWrapper):
         """
         Sets a unique source identifier for each stream metadata in input.
         """
-        identity = f'{self.input_file}#{self.index}'
+        # Stream identifiers are compared while computing scenes and streams
+        # for filter graph, interning allows comparing them by pointer.
+        identity = sys.intern(f'{self.input_file}#{self.index}')
         for stream in self.streams:
             stream.connect_input(identity)
 
@@ -230,12 +240,11 @@ class InputList(list):
 
         :param sources: list of input files
         """
+        # sources may be an iterator, so it is consumed only once
+        sources = list(sources)
         for i, source in enumerate(sources, start=len(self)):
             source.index = i
         super().extend(sources)
 
     def get_args(self) -> List[bytes]:
-        result: List[bytes] = []
-        for source in self:
-            result.extend(source.get_args())
-        return result
+        return list(chain.from_iterable(source.get_args() for source in self))
@@ -8,6 +8,10 @@ else:
     StreamValidationTarget = object
 
 
+_NO_HARDWARE = object()
+""" Marker for filters and codecs without `hardware` attribute."""
+
+
 class StreamValidationMixin(StreamValidationTarget):
     hardware: Optional[str]
 
@@ -27,14 +31,16 @@ class StreamValidationMixin(StreamValidationTarget):
     def validate_edge_device(self, edge: base.Edge) -> None:
         if edge.kind != VIDEO:
             return
+        # `None` hardware means that filter is processed by CPU, so a sentinel
+        # is used to distinguish it from missing `hardware` attribute.
+        filter_hardware = getattr(self, 'hardware', _NO_HARDWARE)
+        if filter_hardware is _NO_HARDWARE:
+            # no hardware restrictions for filter/codec, so metadata is not
+            # computed at all.
+            return
         meta = edge.get_meta_data(self)
         if meta is None:
             return
-        try:
-            filter_hardware = getattr(self, 'hardware')
-        except AttributeError:
-            # no hardware restrictions for filter/codec
-            return
         device = getattr(meta, 'device', None)
         edge_hardware = None if device is None else device.hardware
         if filter_hardware != edge_hardware:
@@ -1,5 +1,5 @@
-from collections import defaultdict
 from dataclasses import dataclass
+from itertools import chain, islice
 from typing import List, cast, Optional, Iterable, Any, Tuple, Dict
 
 from fffw.encoding import mixins
@@ -61,18 +61,21 @@ class Codec(mixins.StreamValidationMixin, base.Dest, BaseWrapper):
         """
         Insert map argument before all rest codec params.
         """
-        args = ['-map', self.map]
-        return ensure_binary(args) + super().get_args()
+        args = [b'-map', ensure_binary(self.map)]
+        args.extend(super().get_args())
+        return args
 
     def as_pairs(self) -> List[Tuple[Optional[str], Optional[str]]]:
         """
         Add stream index suffix to all named params
         """
         pairs = super().as_pairs()
-        result = []
-        for p, v in pairs:
-            result.append((p and f'{p}:{self.index}', v))
-        return result
+        if not any(p for p, _ in pairs):
+            # codec stub without named params may have no index yet
+            return pairs
+        # stream index suffix is the same for all codec parameters
+        suffix = f':{self.index}'
+        return [(p and p + suffix, v) for p, v in pairs]
 
     def clone(self, count: int = 1) -> List["Codec"]:
         """
@@ -97,14 +100,14 @@ class Codec(mixins.StreamValidationMixin, base.Dest, BaseWrapper):
         meta = self.get_meta_data()
         if not meta:
             return None
-        prev = meta.scenes[0]
-        for scene in meta.scenes[1:]:
+        scenes = meta.scenes
+        # adjacent scenes are iterated pairwise without copying scenes list
+        for prev, scene in zip(scenes, islice(scenes, 1, None)):
             if prev.stream == scene.stream and prev.end > scene.start:
                 # Previous scene in same stream is located after current, so
                 # current decoded scene will be buffered until previous scene is
                 # decoded.
                 raise BufferError(prev, scene)
-            prev = scene
         return meta.streams
 
 
@@ -162,15 +165,15 @@ class Output(BaseWrapper):
         :param create: create new codec stub
         :return: first free codec or a new codec stub.
         """
-        try:
-            codec = next(filter(
-                lambda c: not c.connected and c.kind == kind, self.codecs))
-        except StopIteration:
-            if not create:
-                raise KeyError(kind)
-            codec = Codec()
-            codec.kind = kind
-            self.codecs.append(codec)
+        for codec in self.codecs:
+            # stream kind is compared first as it is cheaper than edge check
+            if codec.kind is kind and not codec.connected:
+                return codec
+        if not create:
+            raise KeyError(kind)
+        codec = Codec()
+        codec.kind = kind
+        self.codecs.append(codec)
         return codec
 
     def get_args(self) -> List[bytes]:
@@ -220,10 +223,13 @@ class OutputList(list):
 
     @property
     def codecs(self) -> List[Codec]:
-        result: List[Codec] = []
-        for output in self:
-            result.extend(output.codecs)
-        return result
+        """
+        :returns: codecs of all outputs.
+
+        Not cached, because output codecs list is extended with codec stubs by
+        `Output.get_free_codec`.
+        """
+        return [codec for output in self for codec in output.codecs]
 
     def append(self, output: Output) -> None:
         """
@@ -240,6 +246,8 @@ class OutputList(list):
 
         :param outputs: list of output files
         """
+        # outputs may be an iterator, so it is consumed only once
+        outputs = list(outputs)
         for output in outputs:
             self.__set_index(output)
         super().extend(outputs)
@@ -248,17 +256,16 @@ class OutputList(list):
         """
         Combine all output params together
         """
-        result: List[bytes] = []
-        for output in self:
-            result.extend(output.get_args())
-        return result
+        return list(chain.from_iterable(output.get_args() for output in self))
 
     @staticmethod
     def __set_index(output: Output) -> None:
         """
         Enumerate codecs in output with a stream index in this output
         """
-        indices: Dict[StreamType, int] = defaultdict(lambda: 0)
+        indices: Dict[StreamType, int] = {}
         for codec in output.codecs:
-            codec.index = indices[codec.kind]
-            indices[codec.kind] += 1
+            kind = codec.kind
+            index = indices.get(kind, 0)
+            codec.index = index
+            indices[kind] = index + 1
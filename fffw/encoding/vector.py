@@ -4,8 +4,8 @@ from fffw.graph.meta import AUDIO, VIDEO, StreamType, Meta
 from fffw.graph import base
 from fffw.encoding import filters, inputs, outputs, FFMPEG
 
-Group = Dict[int, Set[int]]
-""" Grouping result."""
+Group = Dict[int, Dict[int, None]]
+""" Grouping result, with insertion-ordered dicts used as ordered sets."""
 PairKey = Tuple[int, int]
 """ Dict key containing ids of two related objects."""
 
@@ -13,41 +13,29 @@ Incoming = Union[inputs.Stream, filters.Filter]
 Outgoing = Union[filters.Filter, outputs.Codec]
 
 
-def group(first: Iterable[Any], second: Iterable[Any]) -> Group:
-    """
-    Group second iterable by first.
-
-    :param first: First iterable. ID of each object in iterable will be used as
-        a key.
-    :param second: Second iterable. ID of each object in iterable will be added
-        to a set, which is a value for corresponding key in first iterable.
-    :returns: A dict that maps single object from first iterable to a set of
-        objects from second iterable by object ids.
-    """
-    src_to_dst: Group = dict()
-    for src, dst in zip(first, second):
-        if src is None:
-            continue
-        dst_set = src_to_dst.setdefault(id(src), set())
-        dst_set.add(id(dst))
-    return src_to_dst
-
-
 def prepare_src_splits(sources: Dict[int, Incoming],
-                       groups: Group) -> Dict[PairKey, filters.Filter]:
+                       groups: Group) -> Dict[PairKey, Incoming]:
     """
     Initialize split filter for each unique group.
 
     Source (which is a group key) is split to N nodes, where N is a number of
-    corresponding outputs related to this source.
+    corresponding outputs related to this source. Source with a single output
+    is used as is.
 
     :param sources: contains sources by object id.
     :param groups: destinations grouped by source id.
-    :returns: split for each src/dst pair.
+    :returns: split (or source itself) for each src/dst pair.
     """
-    src_splits: Dict[PairKey, filters.Filter] = dict()
+    src_splits: Dict[PairKey, Incoming] = dict()
     for src_id, dst_set in groups.items():
         src = sources[src_id]
+        if len(dst_set) == 1 and id(None) not in dst_set:
+            # Split with single output is not needed, so source is connected
+            # to destination directly. Sources skipped by mask are still split
+            # to pass split result to output instead of the source itself.
+            for dst_id in dst_set:
+                src_splits[src_id, dst_id] = src
+            continue
         # Split incoming stream for each destination that will be connected
         # to it.
         for dst_id, s in zip(dst_set, src.split(len(dst_set))):
@@ -74,6 +62,12 @@ def prepare_dst_clones(destinations: Dict[int, Outgoing],
     dst_clones: Dict[Tuple[int, int], Outgoing] = dict()
     for dst_id, src_set in groups.items():
         dst = destinations[dst_id]
+        if len(src_set) == 1:
+            # Single source is connected to destination itself, which is the
+            # most common case, so cloning is skipped.
+            for src_id in src_set:
+                dst_clones[dst_id, src_id] = dst
+            continue
         # Clone destination filter for each source that will be connected
         # to it.
         # noinspection PyTypeChecker
@@ -85,7 +79,7 @@ def prepare_dst_clones(destinations: Dict[int, Outgoing],
 
 def map_sources_to_destinations(
         sources: List[Optional[Incoming]],
-        src_splits: Dict[Tuple[int, int], filters.Filter],
+        src_splits: Dict[Tuple[int, int], Incoming],
         destinations: List[Optional[Outgoing]],
         dst_clones: Dict[Tuple[int, int], Outgoing]
 ) -> "Vector":
@@ -116,24 +110,29 @@ def map_sources_to_destinations(
             # direct link between src and dst already established
             results.append(dst)
             continue
+        # object ids are used as keys for both splits and clones
+        src_id = id(src)
+        dst_id = id(dst)
         # use split instead of initial incoming node
-        split = src_splits[id(src), id(dst)]
+        split = src_splits[src_id, dst_id]
         if dst is None:
             # Skip via mask, pass split to output. We can't use src here
             # because it is already connected to split filter
-            results.append(split)
+            results.append(cast(filters.Filter, split))
             continue
-        clone = dst_clones[id(dst), id(src)]
+        clone = dst_clones[dst_id, src_id]
 
         key = id(split), id(clone)
 
-        if key not in links:
+        result = links.get(key)
+        if result is None:
             # connect same src to same dst only once
             # noinspection PyTypeChecker
-            links[key] = cast(Outgoing, split.connect_dest(clone))
+            result = cast(Outgoing, split.connect_dest(clone))
+            links[key] = result
 
         # add destination node to results
-        results.append(links[key])
+        results.append(result)
     # noinspection PyTypeChecker
     return Vector(cast(Union[List[filters.Filter], List[outputs.Codec]],
                        results))
@@ -158,16 +157,18 @@ def init_filter_vector(filter_class: Type[filters.Filter],
     factory = cast(Callable[..., filters.Filter], filter_class)
     seen_filters: Dict[str, filters.Filter] = dict()
     for param in params:
-        try:
-            f = seen_filters[repr(param)]
-        except KeyError:
+        # repr is used as a key to distinguish equal values of different
+        # types (i.e. 1 and True) and to support unhashable params.
+        key = repr(param)
+        f = seen_filters.get(key)
+        if f is None:
             if isinstance(param, dict):
                 f = factory(**param)
-            elif hasattr(param, '__iter__'):
+            elif isinstance(param, (list, tuple)):
                 f = factory(*param)
             else:
                 f = factory(param)
-            seen_filters[repr(param)] = f
+            seen_filters[key] = f
         vector.append(f)
     return Vector(vector)
 
@@ -181,7 +182,7 @@ def normalize_args(dst: Union[filters.Filter,
                        List[Dict[str, Any]],
                        List[List[Any]],
                        List[Any],
-                   ] = None) -> Tuple["Vector", List[bool]]:
+                   ] = None) -> Tuple["Vector", Optional[List[bool]]]:
     """
     Transform different args to same form: vector of filters/codecs and
     boolean mask with corresponding length.
@@ -192,8 +193,8 @@ def normalize_args(dst: Union[filters.Filter,
         filters to some sources.
     :param params: filter class constructor arguments used to initialize
         a destination filter vector from filter class.
-    :returns: new vector which is a result of applying destination filters
-        to an input streams vector.
+    :returns: destination vector and a mask with corresponding length, or None
+        if mask is omitted.
     """
     if isinstance(dst, type):
         # handle filter class + params
@@ -213,9 +214,7 @@ def normalize_args(dst: Union[filters.Filter,
             # handle filter instance and mask vector
             dst = Vector(dst * len(mask))
         assert len(dst) == len(mask)
-    else:
-        # handle omitted mask
-        mask = [True] * len(dst)
+    # omitted mask is left as None to skip disabling destinations at all
     return dst, mask
 
 
@@ -242,10 +241,10 @@ class Vector(tuple):
                         Iterable[filters.Filter],
                         Iterable[outputs.Codec]]
         if isinstance(source, filters.Filter):
-            iterable = [source]
+            iterable = (source,)
         elif isinstance(source, inputs.Stream):
             # This branch is separated from previous for mypy.
-            iterable = [source]
+            iterable = (source,)
         else:
             iterable = source
         return tuple.__new__(cls, iterable)  # noqa
@@ -271,10 +270,17 @@ class Vector(tuple):
         """
         :returns: a kind of streams in vector.
         """
+        try:
+            return cast(StreamType, self.__dict__['_kind'])
+        except KeyError:
+            pass
+        # Vector is immutable, so stream kinds are checked only once.
         kinds = {s.kind for s in self}
         if len(kinds) != 1:
             raise RuntimeError("multiple kind of streams in vector")
-        return self[0].kind
+        kind = self[0].kind
+        self.__dict__['_kind'] = kind
+        return kind
 
     @property
     def meta(self) -> Meta:
@@ -355,44 +361,71 @@ class Vector(tuple):
         # filter list
         destinations: List[Optional[Outgoing]] = list(dst)
 
-        if len(sources) != len(destinations):
+        src_count = len(sources)
+        dst_count = len(destinations)
+        if src_count != dst_count:
             # Transform source or destination vector to fit vector length.
             # We support connecting single source to multiple destinations or
             # multiple sources to a single destination.
-            if len(sources) == 1:
+            if src_count == 1:
                 # adjusting single source to multiple destinations
-                sources *= len(destinations)
-            elif len(destinations) == 1:
+                sources *= dst_count
+            elif dst_count == 1:
                 # adjusting single destination to multiple sources
-                destinations *= len(sources)
+                destinations *= src_count
             else:
                 raise RuntimeError("Can't apply M sources to N destinations")
 
-        # disabling destinations by mask
-        for i, enabled in enumerate(mask):
-            if not enabled:
-                destinations[i] = None
+        if mask is not None:
+            # disabling destinations by mask; mask may be shorter than
+            # destinations list if single destination was adjusted above
+            masked = zip(destinations, mask)
+            destinations[:len(mask)] = [d if enabled else None
+                                        for d, enabled in masked]
+
+        # sources cache
+        src_by_id: Dict[int, Incoming] = {}
+        # destinations cache
+        dst_by_id: Dict[int, Outgoing] = {}
+        # Destinations grouped by source to prepare Split() filters at next
+        # step.
+        src_to_dst: Group = {}
+        # Sources grouped by destination to prepare destination clone() calls.
+        dst_to_src: Group = {}
+        # number of sources not connected to destinations directly
+        linked = 0
 
-        # connect any codec so an input stream directly without useless splits
         for i, (s, d) in enumerate(zip(sources, destinations)):
             if isinstance(s, base.Source) and isinstance(d, base.Dest):
-                # Stream to Codec direct mapping
+                # connect any codec to an input stream directly without
+                # useless splits
                 s.connect_dest(d)
                 # Removing src from split-based connections
                 sources[i] = None
-
-        # sources cache
-        src_by_id: Dict[int, Incoming] = {
-            id(src): src for src in sources if src is not None}
-        # destinations cache
-        dst_by_id: Dict[int, Outgoing] = {
-            id(dst): dst for dst in destinations if dst is not None}
-
-        # Group destinations by source to prepare Split() filters at next step.
-        src_to_dst = group(sources, destinations)
-
-        # Group sources by destination to prepare destination clone() calls.
-        dst_to_src = group(destinations, sources)
+                s = None
+            src_id = id(s)
+            dst_id = id(d)
+            if s is not None:
+                linked += 1
+                src_by_id[src_id] = s
+                src_to_dst.setdefault(src_id, {})[dst_id] = None
+            if d is not None:
+                dst_by_id[dst_id] = d
+                dst_to_src.setdefault(dst_id, {})[src_id] = None
+
+        if len(src_by_id) == linked and len(dst_by_id) == len(destinations):
+            # All sources and destinations are unique and none of destinations
+            # is disabled by mask, so there is nothing to split or clone.
+            results: List[Outgoing] = []
+            for s, d in zip(sources, destinations):
+                node = cast(Outgoing, d)
+                if s is not None:
+                    # noinspection PyTypeChecker
+                    node = cast(Outgoing, s.connect_dest(node))
+                results.append(node)
+            # noinspection PyTypeChecker
+            return Vector(cast(Union[List[filters.Filter],
+                                     List[outputs.Codec]], results))
 
         # Split sources to have unique input for each unique destination
         # connected to same source
@@ -430,10 +463,18 @@ class SIMD:
         :param results: list of ffmpeg output files.
         :param kwargs: ffmpeg command line arguments.
         """
-        self.validate_input_file(source)
+        # Output validation is cheap, so it is done before iterating input
+        # streams.
         for output in results:
             self.validate_output_file(output)
+        self.validate_input_file(source)
         self.__source = source
+        # first input stream of each kind, used as a source for vectors
+        self.__streams: Dict[StreamType, inputs.Stream] = {}
+        for stream in source.streams:
+            self.__streams.setdefault(stream.kind, stream)
+        # single stream vectors are immutable, so they are built only once
+        self.__vectors: Dict[StreamType, Vector] = {}
         self.__extra: List[inputs.Input] = []
         self.__results = results
         self.__ffmpeg: Optional[FFMPEG] = None
@@ -466,12 +507,14 @@ class SIMD:
         >>> scaled_vector = simd.video.connect(Scale, params=[size1, size2])
         >>> scaled_vector > simd
         """
-        if isinstance(other, (inputs.Stream, filters.Filter)):
-            # finalizing stream excluded from filter graph or single filtered
-            # stream
-            other = Vector(other)
+        # vector is checked first as it is the most common case
         if isinstance(other, Vector):
             return other.connect(self.get_codecs(other.kind))
+        elif isinstance(other, (inputs.Stream, filters.Filter)):
+            # finalizing stream excluded from filter graph or single filtered
+            # stream
+            vector = Vector(other)
+            return vector.connect(self.get_codecs(vector.kind))
         elif isinstance(other, inputs.Input):
             return self.add_input(other)
         else:
@@ -487,7 +530,7 @@ class SIMD:
         """
         if not isinstance(other, filters.Filter):
             return NotImplemented
-        return Vector(self.get_stream(other.kind)).connect(other)
+        return self.__get_vector(other.kind).connect(other)
 
     @staticmethod
     def validate_input_file(input_file: inputs.Input) -> None:
@@ -495,11 +538,11 @@ class SIMD:
         Checks that input file contains streams information with stream
         metadata.
         """
-        if not input_file.streams:
+        streams = input_file.streams
+        if not streams:
             raise ValueError("streams must be set for input file")
-        for stream in input_file.streams:
-            if not stream.meta:
-                raise ValueError("stream metadata must be set for input file")
+        if not all(stream.meta for stream in streams):
+            raise ValueError("stream metadata must be set for input file")
 
     @staticmethod
     def validate_output_file(output: outputs.Output) -> None:
@@ -527,11 +570,11 @@ class SIMD:
             for source in self.__extra:
                 self.__ffmpeg.add_input(source)
 
+            streams = self.__streams
             for output in self.__results:
                 for codec in output.codecs:
-                    if codec.connected:
-                        continue
-                    self.get_stream(codec.kind).connect_dest(codec)
+                    if not codec.connected:
+                        streams[codec.kind].connect_dest(codec)
                 self.__ffmpeg.add_output(output)
 
         return self.__ffmpeg
@@ -541,14 +584,14 @@ class SIMD:
         """
         :returns: a vector with single video input stream
         """
-        return Vector(self.get_stream(VIDEO))
+        return self.__get_vector(VIDEO)
 
     @property
     def audio(self) -> Vector:
         """
         :returns: a vector with single audio input stream
         """
-        return Vector(self.get_stream(AUDIO))
+        return self.__get_vector(AUDIO)
 
     def get_stream(self, kind: StreamType) -> inputs.Stream:
         """
@@ -556,20 +599,29 @@ class SIMD:
         :return: first stream of desired kind from input file
         :raises KeyError: if no streams of this kind found.
         """
-        for stream in self.__source.streams:
-            if stream.kind == kind:
-                return stream
-        raise KeyError(kind)
+        return self.__streams[kind]
 
     def get_codecs(self, kind: StreamType) -> Vector:
         """
         :param kind: desired vector kind
         :return: a vector of all codecs of desired kind for each output.
         """
-        result = []
-        for output in self.__results:
-            result.append(output.get_free_codec(kind, create=False))
-        return Vector(result)
+        # Not cached because free codecs change after each connection.
+        return Vector([output.get_free_codec(kind, create=False)
+                       for output in self.__results])
+
+    def __get_vector(self, kind: StreamType) -> Vector:
+        """
+        :param kind: desired stream kind
+        :return: a vector with first input stream of desired kind.
+        """
+        try:
+            return self.__vectors[kind]
+        except KeyError:
+            pass
+        vector = Vector(self.get_stream(kind))
+        self.__vectors[kind] = vector
+        return vector
 
     def add_input(self, source: inputs.Input) -> inputs.Input:
         """
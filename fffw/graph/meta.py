@@ -115,17 +115,16 @@ def ts(func: Union[BinaryOp, UnaryOp, NullaryOp], *,
         else:
             @wraps(func)
             def wrapper(self: "TS", value: Any) -> "TS":
-                if value is None:
-                    res = cast(BinaryOp, func)(self, value)  # noqa
-                else:
-                    res = cast(BinaryOp, func)(self, TS(value))  # noqa
-                return TS(res)
+                if value is not None and not isinstance(value, TS):
+                    value = TS(value)
+                return TS(cast(BinaryOp, func)(self, value))  # noqa
     elif arg:
         @wraps(func)
         def wrapper(self: "TS", value: Any) -> Any:
-            if value is None:
-                return cast(BinaryOp, func)(self, value)  # noqa
-            return cast(BinaryOp, func)(self, TS(value))  # noqa
+            if value is not None and not isinstance(value, TS):
+                # timestamps are compared without re-creating TS instance
+                value = TS(value)
+            return cast(BinaryOp, func)(self, value)  # noqa
     elif res:
         @wraps(func)
         def wrapper(self: "TS", value: Any) -> "TS":
@@ -340,7 +339,7 @@ class Meta(Internal):
         raise NotImplementedError()
 
 
-@dataclass
+@dataclass(frozen=True)
 class Device:
     """
     Describes hardware device used for video acceleration
@@ -48,12 +48,13 @@ def ensure_binary(x: Any) -> Any:
     * functions are decorated with ensuring binary results
     * all other types are converted to string and encoded
     """
-    if isinstance(x, tuple):
-        return tuple(ensure_binary(y) for y in x)
-    if isinstance(x, list):
-        return list(ensure_binary(y) for y in x)
+    # strings are checked first as the most common argument type
     if isinstance(x, str):
         return x.encode("utf-8")
+    if isinstance(x, list):
+        return [ensure_binary(y) for y in x]
+    if isinstance(x, tuple):
+        return tuple([ensure_binary(y) for y in x])
     if callable(x):
         @wraps(x)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -41,6 +41,12 @@ def param(default: Any = None, name: Optional[str] = None,
 
 _FROZEN = '__frozen__'
 
+ParamRule = Tuple[str, str, Any, bool, Optional[Callable[[Any], Any]]]
+"""
+Rendering rule for a parameter: field name, parameter name, default value
+(MISSING if default is not omitted), stream suffix flag and render function.
+"""
+
 
 @dataclass
 class Params:
@@ -56,18 +62,67 @@ class Params:
 
     def __setattr__(self, key: str, value: Any) -> None:
         """ If class is frozen, forbids instance attributes modification."""
-        frozen = getattr(self, _FROZEN, False)
-        allowed = self.ALLOWED
-        if frozen and key not in allowed:
+        # Allowed attributes (i.e. `enabled`) are checked first to skip frozen
+        # flag lookup for them.
+        if key not in self.ALLOWED and self.__dict__.get(_FROZEN, False):
             raise RuntimeError("Parameters are frozen")
         object.__setattr__(self, key, value)
 
+    @property
+    def _frozen(self) -> bool:
+        """
+        :return: True if instance parameters are frozen.
+        """
+        return bool(self.__dict__.get(_FROZEN, False))
+
     @property
     def _fields(self) -> Tuple[Field, ...]:
         """
         :return: ordered list of dataclass field
         """
-        return fields(self)
+        return self._class_fields()
+
+    @classmethod
+    def _class_fields(cls) -> Tuple[Field, ...]:
+        """
+        :return: ordered list of dataclass fields, cached for each class.
+        """
+        try:
+            return cast(Tuple[Field, ...], cls.__dict__['_fields_cache'])
+        except KeyError:
+            pass
+        result = fields(cls)
+        setattr(cls, '_fields_cache', result)
+        return result
+
+    def _param_rules(self) -> Tuple[ParamRule, ...]:
+        """
+        :return: parameter rendering rules computed from dataclass fields
+            metadata once for each class.
+        """
+        cls = type(self)
+        try:
+            return cast(Tuple[ParamRule, ...], cls.__dict__['_rules'])
+        except KeyError:
+            pass
+        rules = []
+        for f in self._fields:  # type: Field
+            meta = f.metadata
+            if meta.get('skip'):
+                # if field metadata is marked as `skip`
+                continue
+            name = meta.get('name')
+            if name is None:
+                # by default field name is used as parameter name
+                name = f.name
+            # default value is omitted only for fields configurable via __init__
+            default = f.default if f.init else MISSING
+            stream_suffix = bool(meta.get('stream_suffix'))
+            rules.append((f.name, name, default, stream_suffix,
+                          meta.get('render')))
+        result = tuple(rules)
+        setattr(cls, '_rules', result)
+        return result
 
     def as_pairs(self) -> List[Tuple[Optional[str], Optional[str]]]:
         """
@@ -86,10 +141,9 @@ class Params:
         * if value is `True`, parameter is added as a flag without a value
         """
         args = cast(List[Tuple[Optional[str], Optional[str]]], [])
-        for f in self._fields:  # type: Field
-            key = f.name
+        for key, name, default, stream_suffix, render in self._param_rules():
             value = getattr(self, key)
-            if f.default is not MISSING and f.default == value and f.init:
+            if default is not MISSING and default == value:
                 # if field value has default value and is configurable via
                 # __init__, we omit this field
                 continue
@@ -97,17 +151,6 @@ class Params:
                 # if value is not set, we omit this field
                 continue
 
-            meta = f.metadata
-            name = meta.get('name')
-            stream_suffix = meta.get('stream_suffix')
-            skip = meta.get('skip')
-            render = meta.get('render')
-            if skip:
-                # if field metadata is marked as `skip`
-                continue
-            if name is None:
-                # by default field name is used as parameter name
-                name = key
             if stream_suffix:
                 # append stream suffix (':v' or ':a') to parameter name
                 name = f'{name}:{getattr(self, "kind").value}'
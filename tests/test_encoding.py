@@ -63,6 +63,38 @@ class InputsTestCase(BaseTestCase):
 
         self.assertEqual(v3.name, '0:v:0')
 
+    def test_stream_name_not_initialized(self):
+        """ Stream name is available only after input is enumerated."""
+        v = inputs.Stream(StreamType.VIDEO)
+        source = inputs.Input(streams=(v,))
+        self.assertRaises(RuntimeError, getattr, v, 'name')
+
+        inputs.InputList((self.i1, source))
+
+        self.assertEqual(v.name, '1:v:0')
+
+    def test_input_list_from_iterator(self):
+        """ Input list can be extended with an iterator."""
+        il = inputs.InputList(iter((self.i1, self.i2)))
+        self.assertEqual(list(il), [self.i1, self.i2])
+        self.assertEqual(self.a3.name, '1:a:1')
+
+    def test_input_list_streams(self):
+        """
+        Input list streams are updated when input list is modified.
+        """
+        il = inputs.InputList((self.i1,))
+        self.assertEqual(il.streams, [self.v1, self.a1])
+
+        il.append(self.i2)
+
+        self.assertEqual(il.streams,
+                         [self.v1, self.a1, self.a2, self.v2, self.a3])
+
+        del il[0]
+
+        self.assertEqual(il.streams, [self.a2, self.v2, self.a3])
+
     def test_validate_stream_kind(self):
         """
         Stream without proper StreamType can't be added to input.
@@ -241,6 +241,20 @@ class FFMPEGTestCase(BaseTestCase):
             'out.mp4'
         )
 
+    def test_codec_stub_added_to_output(self):
+        """ Codec stub added after output is registered has no params."""
+        ff = FFMPEG('input.mp4')
+        output = outputs.output_file('out.mp4', codecs.VideoCodec('libx264'))
+        ff > output
+        ff.audio > output.audio
+
+        self.assertEqual(ff.get_args(), ensure_binary([
+            '-i', 'input.mp4',
+            '-map', '0:v:0', '-c:v:0', 'libx264',
+            '-map', '0:a:0',
+            'out.mp4'
+        ]))
+
     def test_bypass_without_filter_complex(self):
         """ inputs.Stream bypass with filter_complex missing."""
         ff = self.ffmpeg
@@ -612,3 +626,22 @@ class FFMPEGTestCase(BaseTestCase):
         codec = codecs.VideoCodec("libx264")
         out = scaled > outputs.output_file("output.mp4", codec)
         ff > out
+
+    def test_handle_stderr_markers(self):
+        """ Only lines containing stderr markers are captured."""
+        ff = self.ffmpeg
+        self.assertEqual(ff.handle_stderr('frame=1 fps=0.0\n'), '')
+        self.assertEqual(ff.handle_stderr('[info] some info\n'), '')
+        line = '[error] Invalid data found\n'
+        self.assertEqual(ff.handle_stderr(line), line)
+
+    def test_handle_stderr_overridden_markers(self):
+        """ Overridden stderr markers are used to capture lines."""
+        ff = self.ffmpeg
+        ff.stderr_markers = ['error:', 'fatal:']
+        line = 'error: bad\n'
+        self.assertEqual(ff.handle_stderr(line), line)
+        self.assertEqual(ff.handle_stderr('[error] ignored\n'), '')
+        ff.stderr_markers = ['[error]', 'fatal:']
+        line = 'fatal: bad\n'
+        self.assertEqual(ff.handle_stderr(line), line)
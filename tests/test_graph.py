@@ -445,6 +445,15 @@ class FilterGraphTestCase(FilterGraphBaseTestCase):
         self.assertEqual(vm.start, TS(0))
         self.assertEqual(vm.duration, TS(1.0))
 
+    def test_setpts_expr_normalization(self):
+        """ Whitespace in SetPTS expression is ignored for metadata."""
+        vm = cast(VideoMeta, self.source.video.meta)
+        f = SetPTS(VIDEO, expr='PTS - STARTPTS')
+        self.assertEqual(f.args, 'PTS - STARTPTS')
+        self.assertEqual(f.transform(vm).start, TS(0))
+        with self.assertRaises(NotImplementedError):
+            SetPTS(VIDEO, expr='2*PTS').transform(vm)
+
     def test_filter_validates_stream_kind(self):
         """
         Stream kind is validated for filter.
@@ -490,6 +499,7 @@ class FilterGraphTestCase(FilterGraphBaseTestCase):
         upload = upload.clone(2)[1]
         vm = cast(VideoMeta, upload.meta)
         self.assertEqual(vm.device, cuda)
+        self.assertIs(upload.device, cuda)
 
     def test_codec_metadata_transform(self):
         """
@@ -536,6 +546,93 @@ class FilterGraphTestCase(FilterGraphBaseTestCase):
         split = self.source.video | Split(VIDEO, output_count=3)
         self.assertEqual(split.args, '3')
 
+    def test_filter_hash(self):
+        """
+        Filters are hashable and hash is consistent with equality.
+        """
+        self.assertEqual(hash(Scale(1280, 720)), hash(Scale(1280, 720)))
+        self.assertEqual(hash(Deint()), hash(Deint()))
+        filters = {Scale(1280, 720), Scale(1280, 720), Scale(640, 360),
+                   ScaleCuda(1280, 720)}
+        self.assertEqual(len(filters), 3)
+        cuda = meta.Device(hardware='cuda', name='foo')
+        uploads = {Upload(device=cuda), Upload(device=cuda),
+                   Upload(device=meta.Device(hardware='cuda', name='bar'))}
+        self.assertEqual(len(uploads), 2)
+
+    def test_filter_hash_equal_values(self):
+        """
+        Filters with equal parameters of different types have same hash.
+        """
+        a = Scale(1280, 720)
+        b = Scale(1280.0, 720)  # type: ignore
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len({a, b}), 1)
+
+    def test_filter_hash_allowed_fields(self):
+        """
+        Fields allowed to be modified after initialization are not hashed.
+        """
+
+        @dataclass
+        class Crop(VideoFilter):
+            filter = 'crop'
+            ALLOWED = ('enabled', 'w')
+            w: int = param()
+
+        c = Crop(w=10)
+        h = hash(c)
+        c.w = 20
+        self.assertEqual(hash(c), h)
+        self.assertEqual(hash(c), hash(Crop(w=30)))
+
+    def test_filter_hash_unhashable_values(self):
+        """
+        Filters with unhashable parameter values are hashable by type.
+        """
+
+        @dataclass
+        class Sizes(VideoFilter):
+            filter = 'sizes'
+            sizes: list = param()
+
+        self.assertEqual(len({Sizes(sizes=[1, 2]), Sizes(sizes=[1, 2])}), 1)
+
+    def test_filter_lazy_args(self):
+        """
+        Filter args with lazy parameters are computed on each access.
+        """
+        state = {}
+
+        @dataclass
+        class Lazy(VideoFilter):
+            filter = 'lazy'
+            size: int = param()
+
+        f = Lazy(size=lambda: state['size'])
+        state['size'] = 1
+        self.assertEqual(f.args, 'size=1')
+        state['size'] = 2
+        self.assertEqual(f.args, 'size=2')
+        self.assertEqual(Scale(1280, 720).args, 'w=1280:h=720')
+
+    def test_filter_allowed_args(self):
+        """
+        Filter args with parameters allowed to be modified are not cached.
+        """
+
+        @dataclass
+        class Crop(VideoFilter):
+            filter = 'crop'
+            ALLOWED = ('enabled', 'w')
+            w: int = param()
+
+        c = Crop(w=10)
+        self.assertEqual(c.args, 'w=10')
+        c.w = 20
+        self.assertEqual(c.args, 'w=20')
+
 
 class CopyCodecTestCase(FilterGraphBaseTestCase):
     """
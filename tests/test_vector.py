@@ -29,6 +29,12 @@ class SomeFilter(VideoFilter):
     filter = 'some'
 
 
+@dataclass
+class NamedFilter(VideoFilter):
+    filter = 'named'
+    name: str = param()
+
+
 @dataclass
 class AnotherFilter(VideoFilter):
     filter = 'another'
@@ -67,6 +73,12 @@ class VectorTestCase(BaseTestCase):
         v = Vector([VideoFilter(), AudioFilter()])
         self.assertRaises(RuntimeError, getattr, v, 'kind')
 
+    def test_simd_stream_vectors(self):
+        """ SIMD returns same single stream vector for each stream kind."""
+        self.assertIs(self.simd.video, self.simd.video)
+        self.assertEqual(self.simd.video, Vector(self.source.streams[0]))
+        self.assertEqual(self.simd.audio, Vector(self.source.streams[1]))
+
     def test_vector_dimensions(self):
         """
         Vector to vector connection must be one of 1:N, M:1, K:K.
@@ -185,6 +197,14 @@ class VectorTestCase(BaseTestCase):
             '-map', '[aout1]', '-c:a:0', 'libfdk_aac',
             'output2.mp5')
 
+    def test_single_destination_without_split(self):
+        """ Source with single destination is connected without split."""
+        stream = self.simd.get_stream(AUDIO)
+        volume = Volume(30)
+        cursor = self.simd | volume
+        self.assertIs(cursor[0], volume)
+        self.assertIs(volume.input.input, stream)
+
     def test_same_filter_with_mask(self):
         """ Applying filter works with mask."""
         cursor = self.simd.audio.connect(Volume(30), mask=[False, True])
@@ -250,6 +270,11 @@ class VectorTestCase(BaseTestCase):
             '-map', '[aout1]', '-c:a:0', 'libfdk_aac',
             'output2.mp5')
 
+    def test_apply_filter_with_string_params(self):
+        """ String parameters are passed to filter class as a whole."""
+        cursor = self.simd.video.connect(NamedFilter, params=['first', 'last'])
+        self.assertEqual([f.name for f in cursor], ['first', 'last'])
+
     def test_split_filter_if_vector_differs(self):
         """
         If source vector has different streams, next filter must be cloned.
@@ -161,3 +161,17 @@ class ParamsTestCase(TestCase):
         """
         w = Wrapper(TS(42.0))
         self.assertEqual(w.as_pairs(), [('field', '42.0')])
+
+    def test_fields_cached_per_class(self):
+        """ Dataclass fields are cached separately for each class."""
+
+        @dataclass
+        class Extended(Wrapper):
+            extra: int = param(default=1)
+
+        w = Wrapper(TS(42.0))
+        e = Extended(TS(1.0), extra=2)
+        self.assertEqual([f.name for f in w._fields], ['field'])
+        self.assertEqual([f.name for f in e._fields], ['field', 'extra'])
+        self.assertIs(w._fields, Wrapper(TS(1.0))._fields)
+        self.assertEqual(e.as_pairs(), [('field', '1.0'), ('extra', '2')])